@@ -37,10 +37,10 @@ public class JavaDemoActivity extends AppCompatActivity {
             (ASSET_SOURCE_DIR + "/" + filename);
         BufferedReader reader =
             new BufferedReader(new InputStreamReader(stream));
-        String text = "";
+        StringBuilder text = new StringBuilder();
         String line;
         while ((line = reader.readLine()) != null) {
-            text += line + "\n";
+            text.append(line).append("\n");
         }
 
         Python py = Python.getInstance();
@@ -51,7 +51,7 @@ public class JavaDemoActivity extends AppCompatActivity {
         PyObject formatter = formatters.callAttr("HtmlFormatter");
         PyObject lexer = lexers.callAttr("get_lexer_for_filename", filename);
         String body = pygments.callAttr
-            ("highlight", text, lexer, formatter).toJava(String.class);
+            ("highlight", text.toString(), lexer, formatter).toJava(String.class);
 
         String html = String.format(
             "<html><head><style>%s\n%s</style></head><body>%s</body></html>",
@@ -41,7 +41,7 @@ public abstract class PythonConsoleActivity extends ConsoleActivity {
     public static abstract class Task extends ConsoleActivity.Task {
 
         protected Python py = Python.getInstance();
-        private PyObject sys;
+        private PyObject sys, console;
         private PyObject stdin, stdout, stderr;
         private PyObject realStdin, realStdout, realStderr;
 
@@ -52,7 +52,7 @@ public abstract class PythonConsoleActivity extends ConsoleActivity {
         public Task(Application app, int flags) {
             super(app);
             sys = py.getModule("sys");
-            PyObject console = py.getModule("chaquopy.utils.console");
+            console = py.getModule("chaquopy.utils.console");
             if ((flags & STDIN_ENABLED) != 0) {
                 realStdin = sys.get("stdin");
                 stdin = console.callAttr("ConsoleInputStream", this);
@@ -67,7 +67,6 @@ public abstract class PythonConsoleActivity extends ConsoleActivity {
         /** Create the thread from Python rather than Java, otherwise user code may be surprised
          * to find its Python Thread object marked as "dummy" and "daemon". */
         @Override protected void startThread(Runnable runnable) {
-            PyObject console = py.getModule("chaquopy.utils.console");
             console.callAttr("start_thread", runnable);
         }
 